@@ -9,112 +9,64 @@ from nptdms import tdms
 from nptdms.test.util import TestFile, hexlify_value, string_hexlify
 
 
-class DaqmxDataTests(unittest.TestCase):
-    def setUp(self):
-        logging.getLogger(tdms.__name__).setLevel(logging.DEBUG)
-
-    def test_single_channel_i16(self):
-        """ Test loading a DAQmx file with a single channel of I16 data
-        """
-
-        scaler_metadata = daqmx_scaler_metadata(0, 3, 0)
-        metadata = combine_metadata(
-            root_metadata(),
-            group_metadata(),
-            daqmx_channel_metadata("Channel1", 4, [2], [scaler_metadata]))
-        data = (
-            "01 00"
-            "02 00"
-            "FF FF"
-            "FE FF"
-        )
+# Raw data blocks shared between the single channel test cases
+_I16_DATA = (
+    # Data for segment
+    "01 00"
+    "02 00"
+    "FF FF"
+    "FE FF")
 
-        test_file = TestFile()
-        test_file.add_segment(metadata, data, segment_toc())
-        tdms_data = test_file.load()
 
-        data = tdms_data.object("Group", "Channel1").raw_data
+_I32_DATA = (
+    # Data for segment
+    "01 00 00 00"
+    "02 00 00 00"
+    "FF FF FF FF"
+    "FE FF FF FF")
 
-        self.assertEqual(data.dtype, np.int16)
-        np.testing.assert_array_equal(data, [1, 2, -1, -2])
-
-    def test_single_channel_u16(self):
-        """ Test loading a DAQmx file with a single channel of U16 data
-        """
-
-        scaler_metadata = daqmx_scaler_metadata(0, 2, 0)
-        metadata = combine_metadata(
-            root_metadata(),
-            group_metadata(),
-            daqmx_channel_metadata("Channel1", 4, [2], [scaler_metadata]))
-        data = (
-            # Data for segment
-            "01 00"
-            "02 00"
-            "FF FF"
-            "FE FF"
-        )
-
-        test_file = TestFile()
-        test_file.add_segment(metadata, data, segment_toc())
-        tdms_data = test_file.load()
-
-        data = tdms_data.object("Group", "Channel1").raw_data
-
-        self.assertEqual(data.dtype, np.uint16)
-        np.testing.assert_array_equal(data, [1, 2, 2**16 - 1, 2**16 - 2])
-
-    def test_single_channel_i32(self):
-        """ Test loading a DAQmx file with a single channel of I32 data
-        """
-
-        scaler_metadata = daqmx_scaler_metadata(0, 5, 0)
-        metadata = combine_metadata(
-            root_metadata(),
-            group_metadata(),
-            daqmx_channel_metadata("Channel1", 4, [4], [scaler_metadata]))
-        data = (
-            # Data for segment
-            "01 00 00 00"
-            "02 00 00 00"
-            "FF FF FF FF"
-            "FE FF FF FF"
-        )
 
-        test_file = TestFile()
-        test_file.add_segment(metadata, data, segment_toc())
-        tdms_data = test_file.load()
+# DAQmx type id, expected numpy dtype, raw data width,
+# expected values and raw data for the single channel tests
+_SINGLE_CHANNEL_CASES = [
+    (3, np.int16, 2, [1, 2, -1, -2], _I16_DATA),
+    (2, np.uint16, 2, [1, 2, 2**16 - 1, 2**16 - 2], _I16_DATA),
+    (5, np.int32, 4, [1, 2, -1, -2], _I32_DATA),
+    (4, np.uint32, 4, [1, 2, 2**32 - 1, 2**32 - 2], _I32_DATA),
+]
 
-        data = tdms_data.object("Group", "Channel1").raw_data
 
-        self.assertEqual(data.dtype, np.int32)
-        np.testing.assert_array_equal(data, [1, 2, -1, -2])
+class DaqmxDataTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        logging.getLogger(tdms.__name__).setLevel(logging.WARNING)
 
-    def test_single_channel_u32(self):
-        """ Test loading a DAQmx file with a single channel of U32 data
+    def test_single_channel(self):
+        """ Test loading DAQmx files with a single channel of data
+            of each integer type
         """
 
-        scaler_metadata = daqmx_scaler_metadata(0, 4, 0)
-        metadata = combine_metadata(
-            root_metadata(),
-            group_metadata(),
-            daqmx_channel_metadata("Channel1", 4, [4], [scaler_metadata]))
-        data = (
-            # Data for segment
-            "01 00 00 00"
-            "02 00 00 00"
-            "FF FF FF FF"
-            "FE FF FF FF"
-        )
+        for type_id, dtype, width, expected, raw_data in (
+                _SINGLE_CHANNEL_CASES):
+            scaler_metadata = daqmx_scaler_metadata(0, type_id, 0)
+            metadata = combine_metadata(
+                root_metadata(),
+                group_metadata(),
+                daqmx_channel_metadata(
+                    "Channel1", 4, [width], [scaler_metadata]))
 
-        test_file = TestFile()
-        test_file.add_segment(metadata, data, segment_toc())
-        tdms_data = test_file.load()
+            test_file = TestFile()
+            test_file.add_segment(metadata, raw_data, segment_toc())
+            tdms_data = test_file.load()
 
-        data = tdms_data.object("Group", "Channel1").raw_data
+            data = tdms_data.object("Group", "Channel1").raw_data
 
-        self.assertEqual(data.dtype, np.uint32)
-        np.testing.assert_array_equal(data, [1, 2, 2**32 - 1, 2**32 - 2])
+            self.assertEqual(
+                data.dtype, dtype,
+                msg="Incorrect dtype for type id %d" % type_id)
+            np.testing.assert_array_equal(
+                data, expected,
+                err_msg="Incorrect data for type id %d" % type_id)
 
     def test_two_channel_i16(self):
         """ Test loading a DAQmx file with two channels of I16 data
@@ -264,39 +216,56 @@ class DaqmxDataTests(unittest.TestCase):
         np.testing.assert_array_equal(scaler_2_data, [33, 34, 35, 36])
 
 
+_SEG_TOC = (
+    "kTocMetaData", "kTocRawData", "kTocNewObjList", "kTocDAQmxRawData")
+
+
+_ROOT_META = (
+    # Length of the object path
+    "01 00 00 00"
+    # Object path (/)
+    "2F"
+    # Raw data index
+    "FF FF FF FF"
+    # Num properties
+    "00 00 00 00")
+
+
+_GROUP_META = (
+    # Length of the object path
+    "08 00 00 00"
+    # Object path (/'Group')
+    "2F 27 47 72"
+    "6F 75 70 27"
+    # Raw data index
+    "FF FF FF FF"
+    # Num properties
+    "00 00 00 00")
+
+
+_combined_metadata_cache = {}
+
+
 def combine_metadata(*args):
-    num_objects_hex = hexlify_value("<I", len(args))
-    return num_objects_hex + "".join(args)
+    try:
+        return _combined_metadata_cache[args]
+    except KeyError:
+        num_objects_hex = hexlify_value("<I", len(args))
+        combined = num_objects_hex + "".join(args)
+        _combined_metadata_cache[args] = combined
+        return combined
 
 
 def segment_toc():
-    return (
-        "kTocMetaData", "kTocRawData", "kTocNewObjList", "kTocDAQmxRawData")
+    return _SEG_TOC
 
 
 def root_metadata():
-    return (
-        # Length of the object path
-        "01 00 00 00"
-        # Object path (/)
-        "2F"
-        # Raw data index
-        "FF FF FF FF"
-        # Num properties
-        "00 00 00 00")
+    return _ROOT_META
 
 
 def group_metadata():
-    return (
-        # Length of the object path
-        "08 00 00 00"
-        # Object path (/'Group')
-        "2F 27 47 72"
-        "6F 75 70 27"
-        # Raw data index
-        "FF FF FF FF"
-        # Num properties
-        "00 00 00 00")
+    return _GROUP_META
 
 
 def daqmx_scaler_metadata(scale_id, type_id, byte_offset):